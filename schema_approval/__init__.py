@@ -0,0 +1 @@
+"""Temporal migration of the Conductor ``schema_approval`` workflow."""
@@ -0,0 +1,153 @@
+"""Activity implementations for the schema approval workflow.
+
+Each Conductor ``SIMPLE`` task in the original definition maps to one
+activity here. The implementations simulate the side effects (storage
+writes, reviewer notifications) with structured logging so the sample can
+run without external services.
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Sequence
+
+from temporalio import activity
+
+from .shared import (
+    CompleteReviewRequest,
+    CompletionReport,
+    ReviewAssignment,
+    ReviewOutcome,
+    RevisionRequest,
+    SchemaApprovalResult,
+    SchemaSubmission,
+    UploadSummary,
+)
+
+
+@lru_cache(maxsize=1024)
+def _storage_uri(schema_id: str, version: int) -> str:
+    """Storage URI for a submission, cached for the common retry case.
+
+    Resubmissions of the same ``(schema_id, version)`` reuse the cached
+    string instead of re-formatting it. Pure function, so the cache is safe
+    to share across coroutine invocations.
+    """
+    return f"s3://schemas/{schema_id}/v{version}.json"
+
+
+@activity.defn
+async def upload_schema(submission: SchemaSubmission) -> UploadSummary:
+    """Persist a schema submission and report where it was stored."""
+    storage_location = _storage_uri(submission.schema_id, submission.version)
+    if activity.logger.isEnabledFor(logging.INFO):
+        activity.logger.info(
+            "Uploaded schema %s v%d to %s",
+            submission.schema_id,
+            submission.version,
+            storage_location,
+        )
+    return UploadSummary(
+        schema_id=submission.schema_id,
+        version=submission.version,
+        storage_location=storage_location,
+    )
+
+
+@activity.defn
+async def dispatch_review_request(assignment: ReviewAssignment) -> None:
+    """Notify a reviewer that a submission is waiting on them."""
+    if activity.logger.isEnabledFor(logging.INFO):
+        activity.logger.info(
+            "Dispatching %s review of %s v%d to %s",
+            assignment.stage,
+            assignment.submission.schema_id,
+            assignment.submission.version,
+            assignment.reviewer,
+        )
+
+
+@activity.defn
+async def dispatch_review_requests(assignments: List[ReviewAssignment]) -> None:
+    """Notify several reviewers in one activity task.
+
+    Fan-out stages dispatch to every reviewer at once, so batching the
+    notifications amortizes the per-activity scheduling overhead across
+    the whole stage.
+    """
+    if activity.logger.isEnabledFor(logging.INFO):
+        for assignment in assignments:
+            activity.logger.info(
+                "Dispatching %s review of %s v%d to %s",
+                assignment.stage,
+                assignment.submission.schema_id,
+                assignment.submission.version,
+                assignment.reviewer,
+            )
+
+
+_APPROVED = "approved"
+_REJECTED = "rejected"
+_GET_REVIEWER = attrgetter("reviewer")
+_OUTCOME_LINE_FIELDS = attrgetter("stage", "reviewer", "approved")
+
+
+def summarize_outcomes(outcomes: Sequence[ReviewOutcome]) -> List[str]:
+    """Render one human-readable line per recorded review outcome.
+
+    Written as a pre-sized tight loop: bulk batch reviews can pass large
+    sequences, and the attrgetter fuses the three attribute reads into one
+    C-level call.
+    """
+    out: List[str] = [""] * len(outcomes)
+    get_fields = _OUTCOME_LINE_FIELDS
+    for i, outcome in enumerate(outcomes):
+        stage, reviewer, approved = get_fields(outcome)
+        out[i] = f"{stage} ({reviewer}): {_APPROVED if approved else _REJECTED}"
+    return out
+
+
+@activity.defn
+async def record_revision_request(request: RevisionRequest) -> None:
+    """Log that a submission was rejected and a revision was requested."""
+    if activity.logger.isEnabledFor(logging.WARNING):
+        approver_summary = "; ".join(summarize_outcomes(request.rejections))
+        activity.logger.warning(
+            "Iteration %d of schema %s v%d was rejected: %s",
+            request.iteration,
+            request.submission.schema_id,
+            request.submission.version,
+            approver_summary,
+        )
+
+
+@activity.defn
+async def complete_review(request: CompleteReviewRequest) -> CompletionReport:
+    """Produce the completion summary once every stage has approved."""
+    request.ensure_all_approved()
+    reviewers = ", ".join(map(_GET_REVIEWER, request.approvals))
+    summary = (
+        f"Schema {request.submission.schema_id} approved in iteration "
+        f"{request.iteration} by {reviewers}"
+    )
+    if activity.logger.isEnabledFor(logging.INFO):
+        activity.logger.info("Completed review: %s", summary)
+    return CompletionReport(summary=summary, reviewer_count=len(request.approvals))
+
+
+@activity.defn
+async def finalize_review(result: SchemaApprovalResult) -> str:
+    """Record the final approval and emit an audit log entry."""
+    if activity.logger.isEnabledFor(logging.INFO):
+        # approvers is a stage-ordered tuple of pairs; no sort, no lookups.
+        approver_summary = ", ".join(
+            f"{stage} -> {reviewer}" for stage, reviewer in result.approvers
+        )
+        activity.logger.info(
+            f"Schema {result.schema_id} approved v{result.approved_version} "
+            f"attempts={result.attempts} approvers=[{approver_summary}] "
+            f"completed_at={result.completed_at.isoformat()}"
+        )
+    return f"finalized:{result.schema_id}:v{result.approved_version}"
@@ -0,0 +1,204 @@
+"""Shared dataclasses for the schema approval workflow.
+
+These types model the data flow of the Conductor ``schema_approval``
+definition (see ``conductor-definitions/review_approval.json``): a schema
+submission loops through review rounds until every required reviewer
+approves.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import filterfalse
+from operator import attrgetter
+from typing import Dict, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaSubmission:
+    """One uploaded version of a schema awaiting review."""
+
+    schema_id: str
+    version: int
+    definition: str
+
+
+@dataclass(frozen=True, slots=True)
+class UploadSummary:
+    """Result of persisting a submission to schema storage."""
+
+    schema_id: str
+    version: int
+    storage_location: str
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewAssignment:
+    """Notification payload asking a reviewer to look at a submission."""
+
+    stage: str
+    reviewer: str
+    instructions: str
+    submission: SchemaSubmission
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewDecision:
+    """A reviewer's verdict, delivered to the workflow as a signal."""
+
+    stage: str
+    reviewer: str
+    submission_version: int
+    approved: bool
+    skip_additional_review: bool = False
+    comments: str = ""
+
+    def __post_init__(self) -> None:
+        # Decisions arrive deserialized from signal payloads, so the stage
+        # string is not the interned literal. Intern it at the boundary so
+        # the workflow's stage lookups reduce to pointer comparisons.
+        object.__setattr__(self, "stage", sys.intern(self.stage))
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewOutcome:
+    """A recorded decision for one stage of a review round."""
+
+    stage: str
+    reviewer: str
+    approved: bool
+    skip_additional_review: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class RevisionRequest:
+    """Details of a rejected round sent back to the submitter."""
+
+    submission: SchemaSubmission
+    rejections: Sequence[ReviewOutcome]
+    iteration: int
+
+
+@dataclass(frozen=True, slots=True)
+class CompleteReviewRequest:
+    """Input for the ``complete_review`` activity."""
+
+    submission: SchemaSubmission
+    approvals: Sequence[ReviewOutcome]
+    iteration: int
+
+    def ensure_all_approved(self) -> None:
+        """Raise if any recorded outcome is not an approval."""
+        disapprovals = list(filterfalse(attrgetter("approved"), self.approvals))
+        if disapprovals:
+            reviewers = ", ".join(map(attrgetter("reviewer"), disapprovals))
+            raise ValueError(
+                f"cannot complete review with outstanding rejections from {reviewers}"
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class CompletionReport:
+    """Summary produced once every required stage has approved."""
+
+    summary: str
+    reviewer_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewIterationResult:
+    """Record of one pass through the review loop."""
+
+    iteration: int
+    submission_version: int
+    approved: bool
+    primary: Optional[ReviewOutcome] = None
+    secondary: Optional[ReviewOutcome] = None
+    second_level: Optional[ReviewOutcome] = None
+    final: Optional[ReviewOutcome] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaApprovalResult:
+    """Final workflow result returned to the starter."""
+
+    schema_id: str
+    approved_version: int
+    attempts: int
+    # Stage-ordered (stage, reviewer) pairs instead of a hash table: four
+    # entries do not need one, and the pairs iterate in stable order for
+    # free. Producers must supply them already sorted by stage.
+    approvers: Tuple[Tuple[str, str], ...]
+    summary: str
+    completed_at: datetime
+    history: Sequence[ReviewIterationResult] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaApprovalWorkflowInput:
+    """Input for ``SchemaApprovalWorkflow``.
+
+    ``stage_one_reviewers`` must hold exactly two reviewers, one each for
+    the parallel ``Review1.a`` and ``Review1.b`` stages. With
+    ``speculative_review2`` the senior reviewer is notified alongside
+    Round 1, trading a wasted notification on the rare reject path for
+    one less serial round trip on the common approve path.
+    """
+
+    schema_id: str
+    definition: str
+    stage_one_reviewers: Sequence[str]
+    stage_two_reviewer: str
+    stage_three_reviewer: str
+    speculative_review2: bool = False
+
+    def __post_init__(self) -> None:
+        # Freeze to a tuple so downstream iteration is a C-level tuple walk
+        # rather than generic Sequence dispatch, whatever the caller passed.
+        reviewers = tuple(self.stage_one_reviewers)
+        if len(reviewers) != 2:
+            raise ValueError(
+                f"stage_one_reviewers must hold exactly two reviewers, "
+                f"got {len(reviewers)}"
+            )
+        object.__setattr__(self, "stage_one_reviewers", reviewers)
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewDecisionPlan:
+    """A scripted decision used to simulate one reviewer's response."""
+
+    approved: bool
+    skip_additional_review: bool = False
+    comments: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewRoundPlan:
+    """A scripted pass through the review loop, used by the starter and tests."""
+
+    review1_a: ReviewDecisionPlan
+    review1_b: ReviewDecisionPlan
+    review2: Optional[ReviewDecisionPlan] = None
+    requires_review3: bool = False
+    review3: Optional[ReviewDecisionPlan] = None
+
+    def __post_init__(self) -> None:
+        # A review3 decision must be planned exactly when requires_review3
+        # is set; one comparison covers both invalid combinations.
+        if self.requires_review3 == (self.review3 is None):
+            raise ValueError("review3 decision presence must match requires_review3")
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowStatus:
+    """Snapshot returned by the ``status`` query."""
+
+    iteration: int
+    submission_version: int
+    current_round: Optional[str]
+    awaiting_reviewers: Sequence[str]
+    decisions: Dict[str, str]
+    history: Sequence[str]
@@ -0,0 +1,190 @@
+"""Start a schema approval workflow and drive scripted reviewer decisions.
+
+The starter plays both sides of the approval loop: it submits the schema,
+then follows a sequence of ``ReviewRoundPlan``s to simulate reviewer
+responses (the Conductor ``user_action`` input) until the workflow
+completes. The first demo plan rejects the submission so the
+``repeat_until_approved`` loop is exercised end to end.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from typing import Any, Tuple
+
+from temporalio.client import Client, WorkflowHandle
+
+from .shared import (
+    ReviewDecision,
+    ReviewDecisionPlan,
+    ReviewRoundPlan,
+    SchemaApprovalWorkflowInput,
+)
+from .worker import TASK_QUEUE
+from .workflow import SchemaApprovalWorkflow
+
+_DEMO_PLANS: Tuple[ReviewRoundPlan, ...] = (
+    ReviewRoundPlan(
+        review1_a=ReviewDecisionPlan(approved=True),
+        review1_b=ReviewDecisionPlan(
+            approved=False, comments="Field names are inconsistent"
+        ),
+    ),
+    ReviewRoundPlan(
+        review1_a=ReviewDecisionPlan(approved=True),
+        review1_b=ReviewDecisionPlan(approved=True),
+        review2=ReviewDecisionPlan(approved=True),
+        requires_review3=True,
+        review3=ReviewDecisionPlan(approved=True),
+    ),
+)
+_REVISED_DEFINITION = '{"type": "object", "additionalProperties": false}'
+
+_client: Client | None = None
+_client_lock = asyncio.Lock()
+
+
+async def get_client() -> Client:
+    """Connect once per process and reuse the client on later starts.
+
+    Repeated starts from a loop or test harness would otherwise pay the
+    gRPC channel setup on every invocation.
+    """
+    global _client
+    async with _client_lock:
+        if _client is None:
+            _client = await Client.connect(
+                os.getenv("TEMPORAL_ADDRESS", "localhost:7233")
+            )
+        return _client
+
+
+class DataclassEncoder(json.JSONEncoder):
+    """Single-pass JSON encoder for dataclass trees.
+
+    ``asdict`` walks and deep-copies the whole result before ``json.dumps``
+    traverses it again; encoding dataclasses directly halves the work.
+    """
+
+    def default(self, o: Any) -> Any:
+        if is_dataclass(o):
+            return {f.name: getattr(o, f.name) for f in fields(o)}
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+async def _wait_until_awaiting(
+    handle: WorkflowHandle, stage: str, version: int
+) -> None:
+    """Poll the status query until the workflow is waiting on ``stage``."""
+    while True:
+        status = await handle.query(SchemaApprovalWorkflow.status)
+        if status.submission_version == version and stage in status.awaiting_reviewers:
+            return
+        await asyncio.sleep(0.2)
+
+
+async def _send_decision(
+    handle: WorkflowHandle,
+    stage: str,
+    reviewer: str,
+    plan: ReviewDecisionPlan,
+    version: int,
+) -> None:
+    await _wait_until_awaiting(handle, stage, version)
+    await handle.signal(
+        SchemaApprovalWorkflow.record_review_decision,
+        ReviewDecision(
+            stage=stage,
+            reviewer=reviewer,
+            submission_version=version,
+            approved=plan.approved,
+            skip_additional_review=plan.skip_additional_review,
+            comments=plan.comments,
+        ),
+    )
+
+
+async def _drive_plan(
+    handle: WorkflowHandle,
+    config: SchemaApprovalWorkflowInput,
+    plan: ReviewRoundPlan,
+    version: int,
+) -> bool:
+    """Send the scripted decisions for one pass; return True if it approves."""
+    reviewers = list(config.stage_one_reviewers)
+    await _send_decision(handle, "Review1.a", reviewers[0], plan.review1_a, version)
+    await _send_decision(handle, "Review1.b", reviewers[1], plan.review1_b, version)
+    if not (plan.review1_a.approved and plan.review1_b.approved):
+        return False
+    assert plan.review2 is not None
+    await _send_decision(
+        handle, "Review2", config.stage_two_reviewer, plan.review2, version
+    )
+    if not plan.review2.approved:
+        return False
+    if plan.review3 is None:
+        return plan.review2.skip_additional_review
+    await _send_decision(
+        handle, "Review3", config.stage_three_reviewer, plan.review3, version
+    )
+    return plan.review3.approved
+
+
+async def run_starter() -> None:
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger(__name__)
+    schema_id = sys.argv[1] if len(sys.argv) > 1 else "customer-profile"
+    config = SchemaApprovalWorkflowInput(
+        schema_id=schema_id,
+        definition='{"type": "object"}',
+        stage_one_reviewers=("reviewer-a", "reviewer-b"),
+        stage_two_reviewer="senior-reviewer",
+        stage_three_reviewer="lead-architect",
+    )
+    try:
+        client = await get_client()
+        stamp = time.strftime("%Y%m%d%H%M%S", time.gmtime())
+        workflow_id = f"schema-approval-{schema_id}-{stamp}"
+        logger.info("Starting workflow %s", workflow_id)
+        handle = await client.start_workflow(
+            SchemaApprovalWorkflow.run,
+            config,
+            id=workflow_id,
+            task_queue=TASK_QUEUE,
+        )
+        version = 1
+        for plan in _DEMO_PLANS:
+            approved = await _drive_plan(handle, config, plan, version)
+            if approved:
+                break
+            await handle.signal(
+                SchemaApprovalWorkflow.submit_revision, _REVISED_DEFINITION
+            )
+            version += 1
+        result = await handle.result()
+        print(json.dumps(result, cls=DataclassEncoder, indent=2))
+    except Exception as exc:
+        logger.error("Workflow execution failed: %s", exc)
+        raise SystemExit(1)
+
+
+def main() -> None:
+    """Console script entry point."""
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(run_starter())
+
+
+if __name__ == "__main__":
+    main()
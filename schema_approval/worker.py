@@ -0,0 +1,69 @@
+"""Long-running worker hosting the schema approval workflow and activities."""
+
+import asyncio
+import contextlib
+import logging
+import os
+from pathlib import Path
+
+from temporalio.client import Client
+from temporalio.worker import Worker
+
+from .activities import (
+    complete_review,
+    dispatch_review_request,
+    dispatch_review_requests,
+    finalize_review,
+    record_revision_request,
+    upload_schema,
+)
+from .workflow import SchemaApprovalWorkflow
+
+TASK_QUEUE = "schema-approval-task-queue"
+_PID_FILE = Path("worker.pid")
+
+
+async def run_worker() -> None:
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger(__name__)
+    # Keep the PID-file writes off the event loop thread.
+    await asyncio.to_thread(_PID_FILE.write_text, str(os.getpid()))
+    logger.info("Worker starting")
+    client = await Client.connect(os.getenv("TEMPORAL_ADDRESS", "localhost:7233"))
+    async with Worker(
+        client,
+        task_queue=TASK_QUEUE,
+        workflows=[SchemaApprovalWorkflow],
+        activities=[
+            upload_schema,
+            dispatch_review_request,
+            dispatch_review_requests,
+            record_revision_request,
+            complete_review,
+            finalize_review,
+        ],
+    ):
+        logger.info("Worker ready — polling: %s", TASK_QUEUE)
+        try:
+            while True:
+                await asyncio.sleep(1)
+        except KeyboardInterrupt:
+            logger.info("Worker shutting down…")
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                await asyncio.to_thread(_PID_FILE.unlink)
+
+
+def main() -> None:
+    """Console script entry point."""
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
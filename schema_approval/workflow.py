@@ -0,0 +1,505 @@
+"""Temporal workflow translated from the Conductor ``schema_approval`` definition.
+
+Control-flow mapping from the original JSON:
+
+* ``repeat_until_approved`` (DO_WHILE)      -> the ``while True`` loop in ``run``
+* ``upload_schema`` (SIMPLE)                -> ``upload_schema`` activity
+* ``fork_join`` + ``notification_join``     -> parallel Round 1 dispatch, then a
+  signal wait for both ``Review1.a`` and ``Review1.b`` decisions
+* ``Review1Check``/``Review2Check``/``Review3Check`` (SWITCH) -> ``if`` branches
+* reviewer ``user_action``                  -> the ``record_review_decision`` signal
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import timedelta
+from functools import partial
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+
+from .shared import (
+    CompleteReviewRequest,
+    CompletionReport,
+    ReviewAssignment,
+    ReviewDecision,
+    ReviewIterationResult,
+    ReviewOutcome,
+    RevisionRequest,
+    SchemaApprovalResult,
+    SchemaApprovalWorkflowInput,
+    SchemaSubmission,
+    UploadSummary,
+    WorkflowStatus,
+)
+
+# Activities are referenced by name so this module never imports their
+# implementations, keeping the sandboxed workflow import graph minimal.
+_UPLOAD_SCHEMA = "upload_schema"
+_DISPATCH_REVIEW_REQUEST = "dispatch_review_request"
+_DISPATCH_REVIEW_REQUESTS = "dispatch_review_requests"
+_RECORD_REVISION_REQUEST = "record_revision_request"
+_COMPLETE_REVIEW = "complete_review"
+_FINALIZE_REVIEW = "finalize_review"
+
+_ACTIVITY_TIMEOUT = timedelta(seconds=30)
+_RETRY_POLICY = RetryPolicy(
+    initial_interval=timedelta(seconds=1),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=30),
+    maximum_attempts=5,
+)
+# (stage, instructions) pairs for the Round 1 fan-out; assignments are
+# stamped out from this template instead of rebuilt literal-by-literal.
+_ROUND_ONE_TEMPLATE = (
+    ("Review1.a", "Perform the primary schema review"),
+    ("Review1.b", "Perform the secondary schema review"),
+)
+_REVIEW2_INSTRUCTIONS = "Perform the senior schema review"
+_REVIEW3_INSTRUCTIONS = "Perform the final schema review"
+# Stage tuples are fixed per round; reusing these module-level constants
+# avoids allocating a fresh tuple on every loop iteration.
+_ROUND1_STAGES = ("Review1.a", "Review1.b")
+_SINGLE_STAGES: Dict[str, Tuple[str, ...]] = {
+    "Review2": ("Review2",),
+    "Review3": ("Review3",),
+}
+# One bit and one array slot per stage: membership and duplicate checks
+# on incoming decisions reduce to an AND against a small int, and the
+# signal handler validates the stage with the same lookup.
+_STAGE_BITS: Dict[str, int] = {
+    "Review1.a": 1,
+    "Review1.b": 2,
+    "Review2": 4,
+    "Review3": 8,
+}
+_STAGE_IDX: Dict[str, int] = {
+    "Review1.a": 0,
+    "Review1.b": 1,
+    "Review2": 2,
+    "Review3": 3,
+}
+
+# Every activity in this workflow shares the same timeout and retry policy;
+# binding them once avoids rebuilding the kwargs dict at each call site.
+_execute = partial(
+    workflow.execute_activity,
+    schedule_to_close_timeout=_ACTIVITY_TIMEOUT,
+    retry_policy=_RETRY_POLICY,
+)
+_execute_local = partial(
+    workflow.execute_local_activity,
+    schedule_to_close_timeout=_ACTIVITY_TIMEOUT,
+    retry_policy=_RETRY_POLICY,
+)
+
+
+@workflow.defn
+class SchemaApprovalWorkflow:
+    """Loop a schema submission through review rounds until approved."""
+
+    def __init__(self) -> None:
+        self.current_submission: Optional[SchemaSubmission] = None
+        self.current_round_name: Optional[str] = None
+        self.expected_stages: Tuple[str, ...] = ()
+        # Pending decisions live in a fixed four-slot array indexed by
+        # _STAGE_IDX; _decision_bits tracks which slots are filled.
+        self._decision_bits = 0
+        self._decisions_arr: List[Optional[ReviewDecision]] = [None] * 4
+        self._stage_events: Dict[str, asyncio.Event] = {}
+        # Incrementally maintained views served verbatim by status(), so the
+        # query never rebuilds them from scratch.
+        self._awaiting: set[str] = set()
+        self._decision_summary: Dict[str, str] = {}
+        # Bounded audit trail for the status query. Unbounded free-form
+        # history bloats the cached workflow state that replays rebuild.
+        self._audit_log: Deque[str] = deque(maxlen=64)
+        self.attempts = 0
+        self._history: List[ReviewIterationResult] = []
+        self._pending_definition: Optional[str] = None
+        self._round_one_reviewers: Optional[Tuple[str, ...]] = None
+
+    @workflow.run
+    async def run(self, config: SchemaApprovalWorkflowInput) -> SchemaApprovalResult:
+        version = 1
+        definition = config.definition
+        while True:
+            self.attempts += 1
+            submission = SchemaSubmission(
+                schema_id=config.schema_id, version=version, definition=definition
+            )
+            self.current_submission = submission
+            self._decision_bits = 0
+            self._decisions_arr[:] = (None, None, None, None)
+
+            upload = await _execute_local(
+                _UPLOAD_SCHEMA, submission, result_type=UploadSummary
+            )
+            self._audit_log.append(
+                f"Uploaded {submission.schema_id} v{submission.version} "
+                f"to {upload.storage_location}"
+            )
+
+            review2_dispatch: Optional[asyncio.Task[None]] = None
+            if config.speculative_review2:
+                # Notify the senior reviewer alongside Round 1; a Round 1
+                # reject just wastes one notification.
+                review2_dispatch = asyncio.create_task(
+                    _execute(
+                        _DISPATCH_REVIEW_REQUEST,
+                        self._stage_assignment(
+                            "Review2",
+                            config.stage_two_reviewer,
+                            _REVIEW2_INSTRUCTIONS,
+                        ),
+                    )
+                )
+
+            primary, secondary = await self._run_round_one(config)
+            # One accumulator per iteration, updated as stages settle and
+            # splatted into _record_iteration at whichever exit is taken.
+            outcomes: Dict[str, Optional[ReviewOutcome]] = {
+                "primary": primary,
+                "secondary": secondary,
+                "second_level": None,
+                "final": None,
+            }
+            if (
+                primary is None
+                or secondary is None
+                or not (primary.approved and secondary.approved)
+            ):
+                if review2_dispatch is not None:
+                    review2_dispatch.cancel()
+                    # Observe the task so a dispatch failure that happened
+                    # before the cancel still propagates instead of being
+                    # silently dropped with the abandoned task.
+                    try:
+                        await review2_dispatch
+                    except asyncio.CancelledError:
+                        pass
+                self._record_iteration(approved=False, **outcomes)
+                rejections = tuple(
+                    outcome for outcome in (primary, secondary) if outcome is not None
+                )
+                definition = await self._request_resubmission(rejections)
+                version += 1
+                continue
+
+            second_level = await self._run_single_review(
+                "Review2",
+                config.stage_two_reviewer,
+                _REVIEW2_INSTRUCTIONS,
+                dispatch_task=review2_dispatch,
+            )
+            outcomes["second_level"] = second_level
+            if not second_level.approved:
+                self._record_iteration(approved=False, **outcomes)
+                definition = await self._request_resubmission((second_level,))
+                version += 1
+                continue
+
+            final: Optional[ReviewOutcome] = None
+            if not second_level.skip_additional_review:
+                final = await self._run_single_review(
+                    "Review3",
+                    config.stage_three_reviewer,
+                    _REVIEW3_INSTRUCTIONS,
+                )
+                outcomes["final"] = final
+                if not final.approved:
+                    self._record_iteration(approved=False, **outcomes)
+                    definition = await self._request_resubmission((final,))
+                    version += 1
+                    continue
+
+            self._record_iteration(approved=True, **outcomes)
+            approvals = self._collect_approvals(primary, secondary, second_level, final)
+            report = await _execute(
+                _COMPLETE_REVIEW,
+                CompleteReviewRequest(
+                    submission=submission, approvals=approvals, iteration=self.attempts
+                ),
+                result_type=CompletionReport,
+            )
+
+            # The outcomes in hand already carry the reviewers, and the
+            # stage names are fixed and listed here in sorted order, so the
+            # pairs tuple can be built directly.
+            approvers: Tuple[Tuple[str, str], ...] = (
+                ("Review1.a", primary.reviewer),
+                ("Review1.b", secondary.reviewer),
+                ("Review2", second_level.reviewer),
+            )
+            if final is not None:
+                approvers += (("Review3", final.reviewer),)
+            result = SchemaApprovalResult(
+                schema_id=config.schema_id,
+                approved_version=version,
+                attempts=self.attempts,
+                approvers=approvers,
+                summary=report.summary,
+                completed_at=workflow.now(),
+                # The workflow completes right after, so handing over the
+                # live list (typed as a Sequence) is safe and skips a copy.
+                history=self._history,
+            )
+            await _execute_local(_FINALIZE_REVIEW, result, result_type=str)
+            self._audit_log.append(f"Approved v{version} after {self.attempts} attempt(s)")
+            return result
+
+    async def _run_round_one(
+        self, config: SchemaApprovalWorkflowInput
+    ) -> Tuple[Optional[ReviewOutcome], Optional[ReviewOutcome]]:
+        """Fan out to both stage-one reviewers and wait for their decisions.
+
+        Waits fail-fast: a rejection from either reviewer ends the round
+        immediately, so the other slot may come back as ``None``.
+        """
+        assert self.current_submission is not None
+        submission = self.current_submission
+        self.current_round_name = f"Round1:v{submission.version}"
+        self.expected_stages = _ROUND1_STAGES
+        self._arm_stage_events(self.expected_stages)
+        if self._round_one_reviewers is None:
+            # Already a tuple thanks to the input's __post_init__; cache it
+            # so later iterations skip the attribute walk entirely.
+            self._round_one_reviewers = tuple(config.stage_one_reviewers)
+        assignments = [
+            ReviewAssignment(
+                stage=stage,
+                reviewer=reviewer,
+                instructions=instructions,
+                submission=submission,
+            )
+            for (stage, instructions), reviewer in zip(
+                _ROUND_ONE_TEMPLATE, self._round_one_reviewers, strict=True
+            )
+        ]
+        # Dispatch is a fast, idempotent notification; run it as a local
+        # activity to skip the task-queue round trip and its history events,
+        # and overlap it with the signal wait instead of blocking on it --
+        # decisions can only arrive after reviewers were notified anyway.
+        dispatch = asyncio.create_task(
+            _execute_local(_DISPATCH_REVIEW_REQUESTS, assignments)
+        )
+        decisions = await self._wait_for_stages(self.expected_stages, fail_fast=True)
+        # Surface any dispatch failure before acting on the decisions.
+        await dispatch
+        primary = decisions.get("Review1.a")
+        secondary = decisions.get("Review1.b")
+        return (
+            self._outcome_for(primary) if primary is not None else None,
+            self._outcome_for(secondary) if secondary is not None else None,
+        )
+
+    def _stage_assignment(
+        self, stage: str, reviewer: str, instructions: str
+    ) -> ReviewAssignment:
+        assert self.current_submission is not None
+        return ReviewAssignment(
+            stage=stage,
+            reviewer=reviewer,
+            instructions=instructions,
+            submission=self.current_submission,
+        )
+
+    async def _run_single_review(
+        self,
+        stage: str,
+        reviewer: str,
+        instructions: str,
+        dispatch_task: Optional[asyncio.Task[None]] = None,
+    ) -> ReviewOutcome:
+        """Dispatch one single-reviewer stage and wait for its decision.
+
+        A pre-started ``dispatch_task`` (speculative dispatch) is awaited
+        instead of notifying the reviewer again.
+        """
+        assert self.current_submission is not None
+        submission = self.current_submission
+        self.current_round_name = f"{stage}:v{submission.version}"
+        self.expected_stages = _SINGLE_STAGES[stage]
+        self._arm_stage_events(self.expected_stages)
+        if dispatch_task is None:
+            dispatch_task = asyncio.create_task(
+                _execute(
+                    _DISPATCH_REVIEW_REQUEST,
+                    self._stage_assignment(stage, reviewer, instructions),
+                )
+            )
+        decisions = await self._wait_for_stages(self.expected_stages)
+        await dispatch_task
+        return self._outcome_for(decisions[stage])
+
+    async def _request_resubmission(
+        self, rejections: Sequence[ReviewOutcome]
+    ) -> str:
+        """Record the rejection and wait for the submitter to send a revision."""
+        assert self.current_submission is not None
+        await _execute_local(
+            _RECORD_REVISION_REQUEST,
+            RevisionRequest(
+                submission=self.current_submission,
+                rejections=tuple(rejections),
+                iteration=self.attempts,
+            ),
+        )
+        self._audit_log.append(f"Revision requested after iteration {self.attempts}")
+        await workflow.wait_condition(lambda: self._pending_definition is not None)
+        definition = self._pending_definition
+        assert definition is not None
+        self._pending_definition = None
+        return definition
+
+    def _arm_stage_events(self, stages: Sequence[str]) -> None:
+        """Create one wakeup event per expected stage before dispatching."""
+        bits = self._decision_bits
+        self._stage_events = {stage: asyncio.Event() for stage in stages}
+        self._awaiting = {stage for stage in stages if not bits & _STAGE_BITS[stage]}
+        for stage in stages:
+            if bits & _STAGE_BITS[stage]:
+                self._stage_events[stage].set()
+
+    async def _wait_for_stages(
+        self, stages: Sequence[str], *, fail_fast: bool = False
+    ) -> Dict[str, ReviewDecision]:
+        """Block until every given stage has a decision, then drain them.
+
+        One event per stage, set by record_review_decision, gives a
+        constant-time wakeup instead of re-scanning a wait_condition
+        predicate after every delivered event. With ``fail_fast`` the wait
+        ends on the first rejection, leaving the remaining stages undrained.
+        """
+        self._audit_log.append(f"Waiting on {', '.join(stages)}")
+        if not fail_fast:
+            await asyncio.gather(
+                *(self._stage_events[stage].wait() for stage in stages)
+            )
+            return {stage: self._drain_decision(stage) for stage in stages}
+
+        async def _decided(stage: str) -> str:
+            await self._stage_events[stage].wait()
+            return stage
+
+        decisions: Dict[str, ReviewDecision] = {}
+        waiters = [asyncio.create_task(_decided(stage)) for stage in stages]
+        try:
+            # workflow.as_completed is the deterministic, replay-safe
+            # variant of asyncio.as_completed for workflow code.
+            for future in workflow.as_completed(waiters):
+                stage = await future
+                decision = self._drain_decision(stage)
+                decisions[stage] = decision
+                if not decision.approved:
+                    break
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return decisions
+
+    def _drain_decision(self, stage: str) -> ReviewDecision:
+        """Take a stage's pending decision, clearing its slot and bit."""
+        idx = _STAGE_IDX[stage]
+        decision = self._decisions_arr[idx]
+        assert decision is not None
+        self._decisions_arr[idx] = None
+        self._decision_bits &= ~_STAGE_BITS[stage]
+        return decision
+
+    @staticmethod
+    def _outcome_for(decision: ReviewDecision) -> ReviewOutcome:
+        return ReviewOutcome(
+            stage=decision.stage,
+            reviewer=decision.reviewer,
+            approved=decision.approved,
+            skip_additional_review=decision.skip_additional_review,
+        )
+
+    def _record_iteration(
+        self,
+        *,
+        approved: bool,
+        primary: Optional[ReviewOutcome],
+        secondary: Optional[ReviewOutcome],
+        second_level: Optional[ReviewOutcome],
+        final: Optional[ReviewOutcome],
+    ) -> None:
+        assert self.current_submission is not None
+        self._history.append(
+            ReviewIterationResult(
+                iteration=self.attempts,
+                submission_version=self.current_submission.version,
+                approved=approved,
+                primary=primary,
+                secondary=secondary,
+                second_level=second_level,
+                final=final,
+            )
+        )
+
+    def _collect_approvals(
+        self,
+        primary: ReviewOutcome,
+        secondary: ReviewOutcome,
+        second_level: ReviewOutcome,
+        final: Optional[ReviewOutcome],
+    ) -> Tuple[ReviewOutcome, ...]:
+        return (
+            (primary, secondary, second_level)
+            if final is None
+            else (primary, secondary, second_level, final)
+        )
+
+    @workflow.signal
+    def record_review_decision(self, decision: ReviewDecision) -> None:
+        """Record one reviewer's verdict for the current submission."""
+        cur = self.current_submission
+        bit = _STAGE_BITS.get(decision.stage)
+        if (
+            bit is None
+            or cur is None
+            or decision.submission_version != cur.version
+        ):
+            workflow.logger.warning(
+                "Ignored %s decision for v%d",
+                decision.stage,
+                decision.submission_version,
+            )
+            return
+        if self._decision_bits & bit:
+            workflow.logger.warning("Ignored duplicate %s decision", decision.stage)
+            return
+        self._decision_bits |= bit
+        self._decisions_arr[_STAGE_IDX[decision.stage]] = decision
+        self._awaiting.discard(decision.stage)
+        self._decision_summary[decision.stage] = decision.reviewer
+        event = self._stage_events.get(decision.stage)
+        if event is not None:
+            event.set()
+        self._audit_log.append(
+            f"{decision.reviewer} "
+            f"{'approved' if decision.approved else 'rejected'} {decision.stage}"
+        )
+
+    @workflow.signal
+    def submit_revision(self, definition: str) -> None:
+        """Provide a revised schema definition after a rejection."""
+        self._pending_definition = definition
+        self._audit_log.append("Revision received")
+
+    @workflow.query
+    def status(self) -> WorkflowStatus:
+        """Expose current round progress for pollers."""
+        submission = self.current_submission
+        return WorkflowStatus(
+            iteration=self.attempts,
+            submission_version=submission.version if submission is not None else 0,
+            current_round=self.current_round_name,
+            awaiting_reviewers=tuple(self._awaiting),
+            decisions=self._decision_summary,
+            history=tuple(self._audit_log),
+        )
@@ -0,0 +1,18 @@
+"""Shared fixtures for the workflow test suite."""
+
+from typing import AsyncIterator
+
+import pytest_asyncio
+from temporalio.testing import WorkflowEnvironment
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def env() -> AsyncIterator[WorkflowEnvironment]:
+    """One time-skipping test server shared by the whole session.
+
+    Starting the test server is by far the slowest part of each test, so
+    spin it up once; tests isolate themselves with per-test task queues
+    and workflow ids.
+    """
+    async with await WorkflowEnvironment.start_time_skipping() as environment:
+        yield environment
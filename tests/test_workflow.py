@@ -0,0 +1,219 @@
+"""Workflow tests using Temporal's time-skipping test environment."""
+
+import asyncio
+import uuid
+
+from temporalio.client import WorkflowHandle
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import UnsandboxedWorkflowRunner, Worker
+
+from schema_approval.activities import (
+    complete_review,
+    dispatch_review_request,
+    dispatch_review_requests,
+    finalize_review,
+    record_revision_request,
+    upload_schema,
+)
+from schema_approval.shared import ReviewDecision, SchemaApprovalWorkflowInput
+from schema_approval.workflow import SchemaApprovalWorkflow
+
+_ACTIVITIES = [
+    upload_schema,
+    dispatch_review_request,
+    dispatch_review_requests,
+    record_revision_request,
+    complete_review,
+    finalize_review,
+]
+
+
+def _config(speculative_review2: bool = False) -> SchemaApprovalWorkflowInput:
+    return SchemaApprovalWorkflowInput(
+        schema_id="test-schema",
+        definition='{"type": "object"}',
+        stage_one_reviewers=("reviewer-a", "reviewer-b"),
+        stage_two_reviewer="senior-reviewer",
+        stage_three_reviewer="lead-architect",
+        speculative_review2=speculative_review2,
+    )
+
+
+async def _decide(
+    handle: WorkflowHandle,
+    stage: str,
+    reviewer: str,
+    version: int,
+    approved: bool = True,
+    skip_additional_review: bool = False,
+) -> None:
+    """Wait until the workflow is awaiting ``stage``, then send a decision."""
+    while True:
+        status = await handle.query(SchemaApprovalWorkflow.status)
+        if status.submission_version == version and stage in status.awaiting_reviewers:
+            break
+        await asyncio.sleep(0.05)
+    await handle.signal(
+        SchemaApprovalWorkflow.record_review_decision,
+        ReviewDecision(
+            stage=stage,
+            reviewer=reviewer,
+            submission_version=version,
+            approved=approved,
+            skip_additional_review=skip_additional_review,
+        ),
+    )
+
+
+async def test_full_review_chain_approves(env: WorkflowEnvironment) -> None:
+    task_queue = f"schema-approval-test-{uuid.uuid4()}"
+    async with Worker(
+        env.client,
+        task_queue=task_queue,
+        workflows=[SchemaApprovalWorkflow],
+        activities=_ACTIVITIES,
+        # The sandbox re-imports the workflow module per run; tests trade
+        # that isolation for speed since the suite controls the code.
+        workflow_runner=UnsandboxedWorkflowRunner(),
+    ):
+        handle = await env.client.start_workflow(
+            SchemaApprovalWorkflow.run,
+            _config(),
+            id=f"schema-approval-{uuid.uuid4()}",
+            task_queue=task_queue,
+        )
+        await _decide(handle, "Review1.a", "reviewer-a", 1)
+        await _decide(handle, "Review1.b", "reviewer-b", 1)
+        await _decide(handle, "Review2", "senior-reviewer", 1)
+        await _decide(handle, "Review3", "lead-architect", 1)
+        result = await handle.result()
+    assert result.attempts == 1
+    assert result.approved_version == 1
+    approvers = dict(result.approvers)
+    assert set(approvers) == {"Review1.a", "Review1.b", "Review2", "Review3"}
+    assert approvers["Review3"] == "lead-architect"
+    assert len(result.history) == 1
+    assert result.history[0].approved
+
+
+async def test_senior_reviewer_can_skip_final_review(env: WorkflowEnvironment) -> None:
+    task_queue = f"schema-approval-test-{uuid.uuid4()}"
+    async with Worker(
+        env.client,
+        task_queue=task_queue,
+        workflows=[SchemaApprovalWorkflow],
+        activities=_ACTIVITIES,
+        workflow_runner=UnsandboxedWorkflowRunner(),
+    ):
+        handle = await env.client.start_workflow(
+            SchemaApprovalWorkflow.run,
+            _config(),
+            id=f"schema-approval-{uuid.uuid4()}",
+            task_queue=task_queue,
+        )
+        await _decide(handle, "Review1.a", "reviewer-a", 1)
+        await _decide(handle, "Review1.b", "reviewer-b", 1)
+        await _decide(
+            handle, "Review2", "senior-reviewer", 1, skip_additional_review=True
+        )
+        result = await handle.result()
+    assert result.attempts == 1
+    assert "Review3" not in dict(result.approvers)
+    assert result.summary.startswith("Schema test-schema approved")
+
+
+async def test_rejection_loops_until_revision_is_approved(
+    env: WorkflowEnvironment,
+) -> None:
+    task_queue = f"schema-approval-test-{uuid.uuid4()}"
+    async with Worker(
+        env.client,
+        task_queue=task_queue,
+        workflows=[SchemaApprovalWorkflow],
+        activities=_ACTIVITIES,
+        workflow_runner=UnsandboxedWorkflowRunner(),
+    ):
+        handle = await env.client.start_workflow(
+            SchemaApprovalWorkflow.run,
+            _config(),
+            id=f"schema-approval-{uuid.uuid4()}",
+            task_queue=task_queue,
+        )
+        await _decide(handle, "Review1.a", "reviewer-a", 1)
+        await _decide(handle, "Review1.b", "reviewer-b", 1, approved=False)
+        await handle.signal(
+            SchemaApprovalWorkflow.submit_revision,
+            '{"type": "object", "additionalProperties": false}',
+        )
+        await _decide(handle, "Review1.a", "reviewer-a", 2)
+        await _decide(handle, "Review1.b", "reviewer-b", 2)
+        await _decide(
+            handle, "Review2", "senior-reviewer", 2, skip_additional_review=True
+        )
+        result = await handle.result()
+    assert result.attempts == 2
+    assert result.approved_version == 2
+    assert len(result.history) == 2
+    assert not result.history[0].approved
+    assert result.history[1].approved
+
+
+async def test_speculative_review2_across_reject_and_approve(
+    env: WorkflowEnvironment,
+) -> None:
+    """Drive speculative_review2 through a rejected and an approved iteration.
+
+    The first iteration exercises cancellation of the speculative dispatch
+    on the Round 1 reject path; the second sends the Review2 decision while
+    Round 1 is still in flight, so the Review2 wait is pre-set by
+    _arm_stage_events instead of blocking.
+    """
+    task_queue = f"schema-approval-test-{uuid.uuid4()}"
+    async with Worker(
+        env.client,
+        task_queue=task_queue,
+        workflows=[SchemaApprovalWorkflow],
+        activities=_ACTIVITIES,
+        workflow_runner=UnsandboxedWorkflowRunner(),
+    ):
+        handle = await env.client.start_workflow(
+            SchemaApprovalWorkflow.run,
+            _config(speculative_review2=True),
+            id=f"schema-approval-{uuid.uuid4()}",
+            task_queue=task_queue,
+        )
+        await _decide(handle, "Review1.a", "reviewer-a", 1)
+        await _decide(handle, "Review1.b", "reviewer-b", 1, approved=False)
+        await handle.signal(
+            SchemaApprovalWorkflow.submit_revision,
+            '{"type": "object", "additionalProperties": false}',
+        )
+        # Wait for Round 1 of v2 to arm, then send the Review2 decision
+        # before the Round 1 decisions so it arrives ahead of its round.
+        while True:
+            status = await handle.query(SchemaApprovalWorkflow.status)
+            if (
+                status.submission_version == 2
+                and "Review1.a" in status.awaiting_reviewers
+            ):
+                break
+            await asyncio.sleep(0.05)
+        await handle.signal(
+            SchemaApprovalWorkflow.record_review_decision,
+            ReviewDecision(
+                stage="Review2",
+                reviewer="senior-reviewer",
+                submission_version=2,
+                approved=True,
+                skip_additional_review=True,
+            ),
+        )
+        await _decide(handle, "Review1.a", "reviewer-a", 2)
+        await _decide(handle, "Review1.b", "reviewer-b", 2)
+        result = await handle.result()
+    assert result.attempts == 2
+    assert result.approved_version == 2
+    approvers = dict(result.approvers)
+    assert approvers["Review2"] == "senior-reviewer"
+    assert "Review3" not in approvers
+    assert result.history[1].approved